@@ -7,14 +7,20 @@ Handles alert-to-ticket conversion, ticket lifecycle, and SLA tracking.
 
 import asyncio
 import os
+import time
 from contextlib import asynccontextmanager
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal, Union
 from datetime import datetime
 from fastapi import FastAPI, HTTPException, Depends, Request, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, update, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, and_, or_, update, func, tuple_, text, true
+from sqlalchemy.sql.elements import ColumnElement
+import orjson
 import structlog
+from redis.asyncio import Redis
+from uuid6 import uuid7
 
 # Import shared modules - using installed vms-shared package
 from database import db_manager, get_db
@@ -27,18 +33,42 @@ from models import (
 # Configure logging
 logger = structlog.get_logger()
 
+# Ticket lifecycle states, in lifecycle order; the frozenset backs O(1) checks
+TICKET_STATUSES = ('open', 'assigned', 'in_progress', 'resolved', 'closed', 'false_positive')
+_VALID_STATUSES: frozenset = frozenset(TICKET_STATUSES)
+
+# Optional Redis cache for polled aggregates (disabled when REDIS_URL is unset)
+STATS_CACHE_TTL_SECONDS = int(os.getenv("STATS_CACHE_TTL_SECONDS", "5"))
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "0.25"))
+REDIS_CONNECT_TIMEOUT_SECONDS = float(os.getenv("REDIS_CONNECT_TIMEOUT_SECONDS", "0.25"))
+redis_client: Optional[Redis] = None
+
+# Time-ordered UUIDv7 keeps new primary keys at the right edge of the B-tree
+_new_id = uuid7
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
+    global redis_client
     logger.info("Starting Ticket Service...")
     await db_manager.initialize()
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        # Short timeouts so a hung Redis falls back to the database quickly
+        redis_client = Redis.from_url(
+            redis_url,
+            socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=REDIS_CONNECT_TIMEOUT_SECONDS
+        )
     logger.info("Ticket Service started successfully")
 
     yield
 
     # Shutdown
     logger.info("Shutting down Ticket Service...")
+    if redis_client is not None:
+        await redis_client.aclose()
     await db_manager.cleanup()
     logger.info("Ticket Service shutdown complete")
 
@@ -46,33 +76,146 @@ app = FastAPI(
     title="Ticket Service",
     description="Centralized ticket management for analytics alerts",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# ============================================================================
+# DEPENDENCIES
+# ============================================================================
+
+async def get_ticket_db(db: AsyncSession = Depends(get_db)) -> AsyncSession:
+    """
+    Request-scoped session that keeps attributes loaded after commit.
+
+    With SQLAlchemy's default expire_on_commit, any post-commit attribute
+    access (e.g. logging ticket.id) triggers a refresh SELECT.
+    """
+    db.sync_session.expire_on_commit = False
+    return db
+
+
+# ============================================================================
+# REQUEST SCHEMAS
+# ============================================================================
+
+class CreateTicketIn(BaseModel):
+    """Body for creating a ticket from an analytics alert"""
+    title: str
+    severity: Literal['critical', 'high', 'medium', 'low', 'info']
+    camera_id: int
+    provider_id: str
+    description: Optional[str] = None
+    organization_id: Optional[str] = None
+    vendor_alert_id: Optional[str] = None
+    alert_data: Optional[Dict[str, Any]] = None
+    thumbnail_url: Optional[str] = None
+    video_clip_url: Optional[str] = None
+    detection_count: int = 0
+
+
+class StatusUpdateIn(BaseModel):
+    """Body for updating a ticket's status"""
+    status: str
+    comment: Optional[str] = None
+    is_internal: bool = False
+
+
+class CommentIn(BaseModel):
+    """Body for adding a comment to a ticket"""
+    comment: str = Field(..., min_length=1)
+    is_internal: bool = False
+
+
+# ============================================================================
+# RESPONSE SCHEMAS
+# ============================================================================
+
+# Column types are owned by the vms-shared models, so every field is optional
+# and lenient; validation must never reject a row the database returns.
+
+class TicketCommentOut(BaseModel):
+    """Comment as returned in ticket details"""
+    id: Optional[str] = None
+    comment: Optional[str] = None
+    is_internal: Optional[bool] = None
+    created_at: Optional[datetime] = None
+
+
+class TicketStateHistoryOut(BaseModel):
+    """Status change as returned in ticket details"""
+    id: Optional[str] = None
+    from_status: Optional[str] = None
+    to_status: Optional[str] = None
+    changed_by_user_id: Optional[int] = None
+    changed_at: Optional[datetime] = None
+
+
+class TicketOut(BaseModel):
+    """Ticket details including comments and state history"""
+    id: Optional[str] = None
+    ticket_number: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    severity: Optional[str] = None
+    status: Optional[str] = None
+    camera_id: Optional[int] = None
+    camera_name: Optional[str] = None
+    provider_id: Optional[str] = None
+    provider_name: Optional[str] = None
+    vendor_alert_id: Optional[str] = None
+    assigned_to: Optional[str] = None
+    assigned_at: Optional[datetime] = None
+    alert_data: Optional[Any] = None
+    thumbnail_url: Optional[str] = None
+    video_clip_url: Optional[str] = None
+    detection_count: Optional[int] = None
+    sla_breach: Optional[bool] = None
+    sla_breach_reason: Optional[str] = None
+    first_response_time_seconds: Optional[Union[int, float]] = None
+    resolution_time_seconds: Optional[Union[int, float]] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    comments: List[TicketCommentOut] = []
+    state_history: List[TicketStateHistoryOut] = []
+
+
 # ============================================================================
 # HEALTH CHECK
 # ============================================================================
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Liveness check; does not touch the database"""
+    return {
+        "service": "ticket-service",
+        "status": "healthy",
+        "timestamp": datetime.utcnow()
+    }
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness check; verifies database connectivity"""
     try:
-        from sqlalchemy import text
         async with db_manager.get_session() as session:
             await session.execute(text("SELECT 1"))
 
         return {
             "service": "ticket-service",
-            "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat()
+            "status": "ready",
+            "timestamp": datetime.utcnow()
         }
     except Exception as e:
-        logger.error("Health check failed", error=str(e))
-        return {
-            "service": "ticket-service",
-            "status": "unhealthy",
-            "error": str(e)
-        }
+        logger.error("Readiness check failed", error=str(e))
+        return ORJSONResponse(
+            status_code=503,
+            content={
+                "service": "ticket-service",
+                "status": "unhealthy",
+                "error": str(e)
+            }
+        )
 
 
 # ============================================================================
@@ -81,8 +224,9 @@ async def health_check():
 
 @app.post("/api/tickets")
 async def create_ticket(
+    payload: CreateTicketIn,
     request: Request,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_ticket_db)
 ):
     """
     Create a new ticket from an analytics alert.
@@ -105,41 +249,35 @@ async def create_ticket(
     }
     """
     try:
-        json_data = await request.json()
-
-        # Validate required fields
-        required_fields = ['title', 'severity', 'camera_id', 'provider_id']
-        for field in required_fields:
-            if field not in json_data:
-                raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
+        # Single timestamp shared by the ticket and its initial history row
+        now = datetime.utcnow()
 
         # Generate ticket number
-        ticket_number = f"TKT-{int(datetime.utcnow().timestamp())}"
+        ticket_number = f"TKT-{time.time_ns()}"
 
         # Create ticket
-        import uuid
         ticket = Ticket(
-            id=str(uuid.uuid4()),
+            id=str(_new_id()),
             ticket_number=ticket_number,
-            title=json_data['title'],
-            description=json_data.get('description'),
-            severity=json_data['severity'],
+            title=payload.title,
+            description=payload.description,
+            severity=payload.severity,
             status="open",
-            camera_id=json_data['camera_id'],
-            organization_id=json_data.get('organization_id'),
-            provider_id=json_data['provider_id'],
-            vendor_alert_id=json_data.get('vendor_alert_id'),
-            alert_data=json_data.get('alert_data'),
-            thumbnail_url=json_data.get('thumbnail_url'),
-            video_clip_url=json_data.get('video_clip_url'),
-            detection_count=json_data.get('detection_count', 0),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            camera_id=payload.camera_id,
+            organization_id=payload.organization_id,
+            provider_id=payload.provider_id,
+            vendor_alert_id=payload.vendor_alert_id,
+            alert_data=payload.alert_data,
+            thumbnail_url=payload.thumbnail_url,
+            video_clip_url=payload.video_clip_url,
+            detection_count=payload.detection_count,
+            created_at=now,
+            updated_at=now
         )
 
         db.add(ticket)
-        await db.commit()
-        await db.refresh(ticket)
+        # Flush so the ticket row exists for the history FK; commit once below
+        await db.flush()
 
         # Create initial state history
         # Get user ID from request headers (set by API Gateway) or use system user
@@ -150,12 +288,12 @@ async def create_ticket(
             user_id = 1
 
         state_history = TicketStateHistory(
-            id=str(uuid.uuid4()),
+            id=str(_new_id()),
             ticket_id=ticket.id,
             from_status="",
             to_status="open",
             changed_by_user_id=user_id,
-            changed_at=datetime.utcnow()
+            changed_at=now
         )
         db.add(state_history)
         await db.commit()
@@ -180,162 +318,341 @@ async def create_ticket(
         raise HTTPException(status_code=500, detail="Failed to create ticket")
 
 
+def _ticket_filters(**criteria) -> ColumnElement:
+    """Combine equality filters on Ticket columns, skipping unset values"""
+    return and_(
+        true(),
+        *(getattr(Ticket, column) == value for column, value in criteria.items() if value)
+    )
+
+
 @app.get("/api/tickets")
 async def list_tickets(
-    db: AsyncSession = Depends(get_db),
     status: Optional[str] = Query(None, description="Filter by status"),
     severity: Optional[str] = Query(None, description="Filter by severity"),
     camera_id: Optional[int] = Query(None, description="Filter by camera"),
     organization_id: Optional[str] = Query(None, description="Filter by organization"),
     assigned_to: Optional[int] = Query(None, description="Filter by assigned user"),
     limit: int = Query(100, le=500),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    after_created_at: Optional[datetime] = Query(None, description="Keyset cursor: created_at of last seen ticket"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: id of last seen ticket")
 ):
     """
     List tickets with optional filters.
 
-    Returns paginated list of tickets.
+    Returns paginated list of tickets. Pass the returned next_cursor values as
+    after_created_at/after_id to seek to the next page; offset cannot be
+    combined with a cursor.
     """
     try:
-        # Build query with filters
-        query = select(Ticket).options(
-            selectinload(Ticket.camera),
-            selectinload(Ticket.provider),
-            selectinload(Ticket.assigned_to)
+        if (after_created_at is None) != (after_id is None):
+            raise HTTPException(
+                status_code=400,
+                detail="after_created_at and after_id must be provided together"
+            )
+        if after_id is not None and offset:
+            raise HTTPException(
+                status_code=400,
+                detail="offset cannot be combined with after_created_at/after_id"
+            )
+
+        filters = _ticket_filters(
+            status=status,
+            severity=severity,
+            camera_id=camera_id,
+            organization_id=organization_id,
+            assigned_to_user_id=assigned_to
         )
 
-        # Apply filters
-        filters = []
-        if status:
-            filters.append(Ticket.status == status)
-        if severity:
-            filters.append(Ticket.severity == severity)
-        if camera_id:
-            filters.append(Ticket.camera_id == camera_id)
-        if organization_id:
-            filters.append(Ticket.organization_id == organization_id)
-        if assigned_to:
-            filters.append(Ticket.assigned_to_user_id == assigned_to)
-
-        if filters:
-            query = query.where(and_(*filters))
-
-        # Order by created_at descending
-        query = query.order_by(Ticket.created_at.desc())
-
-        # Get total count
-        count_query = select(func.count()).select_from(Ticket)
-        if filters:
-            count_query = count_query.where(and_(*filters))
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
+        if after_id is None:
+            total_count = func.count().over()
+        else:
+            # The seek predicate narrows the page, so count the full filtered
+            # set in an uncorrelated subquery instead of over the window
+            total_count = (
+                select(func.count())
+                .select_from(Ticket)
+                .where(filters)
+                .correlate(None)
+                .scalar_subquery()
+            )
 
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        # Select only the columns returned in the listing; rows are
+        # serialized positionally to bypass ORM instance construction
+        query = (
+            select(
+                Ticket.id,
+                Ticket.ticket_number,
+                Ticket.title,
+                Ticket.description,
+                Ticket.severity,
+                Ticket.status,
+                Ticket.camera_id,
+                Camera.name,
+                Ticket.provider_id,
+                AnalyticsProvider.name,
+                User.username,
+                Ticket.created_at,
+                Ticket.updated_at,
+                Ticket.thumbnail_url,
+                Ticket.sla_breach,
+                total_count.label('total_count')
+            )
+            .select_from(Ticket)
+            .outerjoin(Camera, Ticket.camera_id == Camera.id)
+            .outerjoin(AnalyticsProvider, Ticket.provider_id == AnalyticsProvider.id)
+            .outerjoin(User, Ticket.assigned_to_user_id == User.id)
+        )
 
-        # Execute query
-        result = await db.execute(query)
-        tickets = result.scalars().all()
+        query = query.where(filters)
 
-        return {
-            "tickets": [
-                {
-                    "id": t.id,
-                    "ticket_number": t.ticket_number,
-                    "title": t.title,
-                    "description": t.description,
-                    "severity": t.severity,
-                    "status": t.status,
-                    "camera_id": t.camera_id,
-                    "camera_name": t.camera.name if t.camera else None,
-                    "provider_id": t.provider_id,
-                    "provider_name": t.provider.name if t.provider else None,
-                    "assigned_to": t.assigned_to.username if t.assigned_to else None,
-                    "created_at": t.created_at.isoformat() if t.created_at else None,
-                    "updated_at": t.updated_at.isoformat() if t.updated_at else None,
-                    "thumbnail_url": t.thumbnail_url,
-                    "sla_breach": t.sla_breach
-                }
-                for t in tickets
-            ],
-            "total": total,
-            "limit": limit,
-            "offset": offset
-        }
+        # Order by created_at descending, id breaking ties for the cursor
+        query = query.order_by(Ticket.created_at.desc(), Ticket.id.desc())
 
+        # Apply pagination
+        if after_id is not None:
+            query = query.where(
+                tuple_(Ticket.created_at, Ticket.id) < tuple_(after_created_at, after_id)
+            )
+            query = query.limit(limit)
+        else:
+            query = query.limit(limit).offset(offset)
+
+        # Prime the stream so query errors surface as a 500 rather than a
+        # truncated 200 response
+        chunks = _stream_ticket_page(query, limit, offset)
+        first_chunk = await chunks.__anext__()
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Failed to list tickets", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to list tickets")
 
+    return StreamingResponse(
+        _prepend_chunk(first_chunk, chunks),
+        media_type="application/json"
+    )
 
-@app.get("/api/tickets/{ticket_id}")
-async def get_ticket(
-    ticket_id: str,
-    db: AsyncSession = Depends(get_db)
+
+async def _stream_ticket_page(query, limit: int, offset: int):
+    """
+    Yield a ticket list response as JSON chunks.
+
+    Rows are fetched in batches of 200 and encoded with orjson per batch; the
+    total count rides along on every row. The whole page is fetched and
+    encoded before the first chunk is yielded so the pooled connection is
+    released before any bytes are sent, and a slow or stalled client cannot
+    hold it checked out.
+    """
+    chunks = []
+    total = 0
+    count = 0
+    last = None
+    async with db_manager.get_session() as session:
+        result = await session.stream(query.execution_options(yield_per=200))
+        async for rows in result.partitions():
+            if not count:
+                total = rows[0].total_count
+            chunk = b",".join(
+                orjson.dumps({
+                    "id": r[0],
+                    "ticket_number": r[1],
+                    "title": r[2],
+                    "description": r[3],
+                    "severity": r[4],
+                    "status": r[5],
+                    "camera_id": r[6],
+                    "camera_name": r[7],
+                    "provider_id": r[8],
+                    "provider_name": r[9],
+                    "assigned_to": r[10],
+                    "created_at": r[11],
+                    "updated_at": r[12],
+                    "thumbnail_url": r[13],
+                    "sla_breach": r[14]
+                })
+                for r in rows
+            )
+            chunks.append(b"," + chunk if count else chunk)
+            count += len(rows)
+            last = rows[-1]
+
+    next_cursor = None
+    if last is not None and count == limit:
+        next_cursor = {"after_created_at": last[11], "after_id": last[0]}
+
+    yield b'{"tickets":['
+    for chunk in chunks:
+        yield chunk
+
+    # Close the array and append the remaining top-level keys
+    yield b"]," + orjson.dumps({
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor
+    })[1:]
+
+
+async def _prepend_chunk(first: bytes, rest):
+    """Re-attach an already consumed first chunk to a chunk stream"""
+    yield first
+    async for chunk in rest:
+        yield chunk
+
+
+@app.get("/api/tickets/stats")
+async def get_ticket_stats(
+    db: AsyncSession = Depends(get_db),
+    organization_id: Optional[str] = Query(None)
 ):
+    """Get ticket statistics (cached briefly in Redis when configured)"""
+    if organization_id:
+        cache_key = f"ticket:stats:org:{organization_id}"
+    else:
+        cache_key = "ticket:stats:all"
+    if redis_client is not None:
+        try:
+            cached = await redis_client.get(cache_key)
+            if cached:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.warning("Stats cache read failed", error=str(e))
+
+    try:
+        # Scan the filtered tickets once and compute every aggregate over it
+        base = (
+            select(Ticket.status, Ticket.severity, Ticket.sla_breach)
+            .where(_ticket_filters(organization_id=organization_id))
+            .cte('filtered_tickets')
+        )
+        query = select(
+            func.count().label('total'),
+            func.count().filter(base.c.status == 'open').label('open'),
+            func.count().filter(base.c.status == 'assigned').label('assigned'),
+            func.count().filter(base.c.status == 'in_progress').label('in_progress'),
+            func.count().filter(base.c.status == 'resolved').label('resolved'),
+            func.count().filter(base.c.status == 'closed').label('closed'),
+            func.count().filter(base.c.status == 'false_positive').label('false_positive'),
+            func.count().filter(base.c.severity == 'critical').label('critical'),
+            func.count().filter(base.c.severity == 'high').label('high'),
+            func.count().filter(base.c.severity == 'medium').label('medium'),
+            func.count().filter(base.c.severity == 'low').label('low'),
+            func.count().filter(base.c.severity == 'info').label('info'),
+            func.count().filter(base.c.sla_breach == True).label('sla_breaches')
+        ).select_from(base)
+
+        result = await db.execute(query)
+        counts = result.one()
+
+        total = counts.total
+        status_counts = {
+            status: getattr(counts, status)
+            for status in TICKET_STATUSES
+        }
+        severity_counts = {
+            severity: getattr(counts, severity)
+            for severity in ['critical', 'high', 'medium', 'low', 'info']
+        }
+        sla_breaches = counts.sla_breaches
+
+        stats = {
+            "total_tickets": total,
+            "by_status": status_counts,
+            "by_severity": severity_counts,
+            "sla_breaches": sla_breaches,
+            "timestamp": datetime.utcnow()
+        }
+
+    except Exception as e:
+        logger.error("Failed to get ticket stats", error=str(e))
+        raise HTTPException(status_code=500, detail="Failed to get ticket stats")
+
+    if redis_client is not None:
+        try:
+            await redis_client.set(cache_key, orjson.dumps(stats), ex=STATS_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning("Stats cache write failed", error=str(e))
+
+    return stats
+
+
+@app.get("/api/tickets/{ticket_id}", response_model=TicketOut)
+async def get_ticket(ticket_id: str):
     """Get ticket details including comments and history"""
     try:
-        # Get ticket with relationships
-        result = await db.execute(
-            select(Ticket)
+        # Ticket, comments and history are independent reads, so run them
+        # concurrently, each on its own session
+        ticket_query = (
+            select(
+                Ticket.id,
+                Ticket.ticket_number,
+                Ticket.title,
+                Ticket.description,
+                Ticket.severity,
+                Ticket.status,
+                Ticket.camera_id,
+                Camera.name.label('camera_name'),
+                Ticket.provider_id,
+                AnalyticsProvider.name.label('provider_name'),
+                Ticket.vendor_alert_id,
+                User.username.label('assigned_to'),
+                Ticket.assigned_at,
+                Ticket.alert_data,
+                Ticket.thumbnail_url,
+                Ticket.video_clip_url,
+                Ticket.detection_count,
+                Ticket.sla_breach,
+                Ticket.sla_breach_reason,
+                Ticket.first_response_time_seconds,
+                Ticket.resolution_time_seconds,
+                Ticket.created_at,
+                Ticket.updated_at
+            )
+            .select_from(Ticket)
+            .outerjoin(Camera, Ticket.camera_id == Camera.id)
+            .outerjoin(AnalyticsProvider, Ticket.provider_id == AnalyticsProvider.id)
+            .outerjoin(User, Ticket.assigned_to_user_id == User.id)
             .where(Ticket.id == ticket_id)
-            .options(
-                selectinload(Ticket.camera),
-                selectinload(Ticket.provider),
-                selectinload(Ticket.assigned_to),
-                selectinload(Ticket.comments),
-                selectinload(Ticket.state_history)
+        )
+        comments_query = (
+            select(
+                TicketComment.id,
+                TicketComment.comment,
+                TicketComment.is_internal,
+                TicketComment.created_at
             )
+            .where(TicketComment.ticket_id == ticket_id)
+            .order_by(TicketComment.created_at)
+        )
+        history_query = (
+            select(
+                TicketStateHistory.id,
+                TicketStateHistory.from_status,
+                TicketStateHistory.to_status,
+                TicketStateHistory.changed_by_user_id,
+                TicketStateHistory.changed_at
+            )
+            .where(TicketStateHistory.ticket_id == ticket_id)
+            .order_by(TicketStateHistory.changed_at)
         )
-        ticket = result.scalar_one_or_none()
 
-        if not ticket:
+        tickets, comments, state_history = await asyncio.gather(
+            _fetch_dicts(ticket_query),
+            _fetch_dicts(comments_query),
+            _fetch_dicts(history_query)
+        )
+
+        if not tickets:
             raise HTTPException(status_code=404, detail="Ticket not found")
 
-        return {
-            "id": ticket.id,
-            "ticket_number": ticket.ticket_number,
-            "title": ticket.title,
-            "description": ticket.description,
-            "severity": ticket.severity,
-            "status": ticket.status,
-            "camera_id": ticket.camera_id,
-            "camera_name": ticket.camera.name if ticket.camera else None,
-            "provider_id": ticket.provider_id,
-            "provider_name": ticket.provider.name if ticket.provider else None,
-            "vendor_alert_id": ticket.vendor_alert_id,
-            "assigned_to": ticket.assigned_to.username if ticket.assigned_to else None,
-            "assigned_at": ticket.assigned_at.isoformat() if ticket.assigned_at else None,
-            "alert_data": ticket.alert_data,
-            "thumbnail_url": ticket.thumbnail_url,
-            "video_clip_url": ticket.video_clip_url,
-            "detection_count": ticket.detection_count,
-            "sla_breach": ticket.sla_breach,
-            "sla_breach_reason": ticket.sla_breach_reason,
-            "first_response_time_seconds": ticket.first_response_time_seconds,
-            "resolution_time_seconds": ticket.resolution_time_seconds,
-            "created_at": ticket.created_at.isoformat() if ticket.created_at else None,
-            "updated_at": ticket.updated_at.isoformat() if ticket.updated_at else None,
-            "comments": [
-                {
-                    "id": c.id,
-                    "comment": c.comment,
-                    "is_internal": c.is_internal,
-                    "created_at": c.created_at.isoformat() if c.created_at else None
-                }
-                for c in ticket.comments
-            ],
-            "state_history": [
-                {
-                    "id": h.id,
-                    "from_status": h.from_status,
-                    "to_status": h.to_status,
-                    "changed_by_user_id": h.changed_by_user_id,
-                    "changed_at": h.changed_at.isoformat() if h.changed_at else None
-                }
-                for h in ticket.state_history
-            ]
-        }
+        # Validated and serialized by the compiled TicketOut schema
+        ticket = tickets[0]
+        ticket["comments"] = comments
+        ticket["state_history"] = state_history
+        return ticket
 
     except HTTPException:
         raise
@@ -344,11 +661,19 @@ async def get_ticket(
         raise HTTPException(status_code=500, detail="Failed to get ticket")
 
 
+async def _fetch_dicts(query) -> List[Dict[str, Any]]:
+    """Run a read query on a dedicated session and return rows as dicts"""
+    async with db_manager.get_session() as session:
+        result = await session.execute(query)
+        return [dict(row._mapping) for row in result]
+
+
 @app.patch("/api/tickets/{ticket_id}/status")
 async def update_ticket_status(
     ticket_id: str,
+    payload: StatusUpdateIn,
     request: Request,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_ticket_db)
 ):
     """
     Update ticket status.
@@ -360,29 +685,33 @@ async def update_ticket_status(
     }
     """
     try:
-        json_data = await request.json()
-        new_status = json_data.get('status')
-
-        if not new_status:
-            raise HTTPException(status_code=400, detail="Missing required field: status")
+        now = datetime.utcnow()
+        new_status = payload.status
 
         # Validate status
-        valid_statuses = ['open', 'assigned', 'in_progress', 'resolved', 'closed', 'false_positive']
-        if new_status not in valid_statuses:
-            raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
+        if new_status not in _VALID_STATUSES:
+            raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {list(TICKET_STATUSES)}")
 
-        # Get ticket
-        result = await db.execute(select(Ticket).where(Ticket.id == ticket_id))
-        ticket = result.scalar_one_or_none()
+        # Lock the ticket row and read its current status
+        result = await db.execute(
+            select(Ticket.status)
+            .where(Ticket.id == ticket_id)
+            .with_for_update()
+        )
+        old_status_row = result.one_or_none()
 
-        if not ticket:
+        if old_status_row is None:
             raise HTTPException(status_code=404, detail="Ticket not found")
 
-        old_status = ticket.status
+        old_status = old_status_row[0]
 
         # Update ticket
-        ticket.status = new_status
-        ticket.updated_at = datetime.utcnow()
+        await db.execute(
+            update(Ticket)
+            .where(Ticket.id == ticket_id)
+            .values(status=new_status, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
 
         # Create state history
         # Get user ID from request headers (set by API Gateway) or use system user
@@ -392,27 +721,28 @@ async def update_ticket_status(
         except (ValueError, TypeError):
             user_id = 1
 
-        import uuid
-        state_history = TicketStateHistory(
-            id=str(uuid.uuid4()),
-            ticket_id=ticket.id,
-            from_status=old_status,
-            to_status=new_status,
-            changed_by_user_id=user_id,
-            changed_at=datetime.utcnow()
+        await db.execute(
+            insert(TicketStateHistory).values(
+                id=str(_new_id()),
+                ticket_id=ticket_id,
+                from_status=old_status,
+                to_status=new_status,
+                changed_by_user_id=user_id,
+                changed_at=now
+            )
         )
-        db.add(state_history)
 
         # Add comment if provided
-        if json_data.get('comment'):
-            comment = TicketComment(
-                id=str(uuid.uuid4()),
-                ticket_id=ticket.id,
-                comment=json_data['comment'],
-                is_internal=json_data.get('is_internal', False),
-                created_at=datetime.utcnow()
+        if payload.comment:
+            await db.execute(
+                insert(TicketComment).values(
+                    id=str(_new_id()),
+                    ticket_id=ticket_id,
+                    comment=payload.comment,
+                    is_internal=payload.is_internal,
+                    created_at=now
+                )
             )
-            db.add(comment)
 
         await db.commit()
 
@@ -438,8 +768,8 @@ async def update_ticket_status(
 @app.post("/api/tickets/{ticket_id}/comments")
 async def add_comment(
     ticket_id: str,
-    request: Request,
-    db: AsyncSession = Depends(get_db)
+    payload: CommentIn,
+    db: AsyncSession = Depends(get_ticket_db)
 ):
     """
     Add a comment to a ticket.
@@ -451,10 +781,7 @@ async def add_comment(
     }
     """
     try:
-        json_data = await request.json()
-
-        if not json_data.get('comment'):
-            raise HTTPException(status_code=400, detail="Missing required field: comment")
+        now = datetime.utcnow()
 
         # Verify ticket exists
         result = await db.execute(select(Ticket).where(Ticket.id == ticket_id))
@@ -464,26 +791,25 @@ async def add_comment(
             raise HTTPException(status_code=404, detail="Ticket not found")
 
         # Create comment
-        import uuid
         comment = TicketComment(
-            id=str(uuid.uuid4()),
+            id=str(_new_id()),
             ticket_id=ticket_id,
-            comment=json_data['comment'],
-            is_internal=json_data.get('is_internal', False),
-            created_at=datetime.utcnow()
+            comment=payload.comment,
+            is_internal=payload.is_internal,
+            created_at=now
         )
 
         db.add(comment)
+        comment_id = comment.id
         await db.commit()
-        await db.refresh(comment)
 
         logger.info("Comment added to ticket",
                    ticket_id=ticket_id,
-                   comment_id=comment.id)
+                   comment_id=comment_id)
 
         return {
             "message": "Comment added successfully",
-            "comment_id": comment.id,
+            "comment_id": comment_id,
             "ticket_id": ticket_id
         }
 
@@ -494,62 +820,6 @@ async def add_comment(
         raise HTTPException(status_code=500, detail="Failed to add comment")
 
 
-@app.get("/api/tickets/stats")
-async def get_ticket_stats(
-    db: AsyncSession = Depends(get_db),
-    organization_id: Optional[str] = Query(None)
-):
-    """Get ticket statistics"""
-    try:
-        filters = []
-        if organization_id:
-            filters.append(Ticket.organization_id == organization_id)
-
-        # Total tickets
-        total_query = select(func.count()).select_from(Ticket)
-        if filters:
-            total_query = total_query.where(and_(*filters))
-        total_result = await db.execute(total_query)
-        total = total_result.scalar()
-
-        # Count by status
-        status_counts = {}
-        for status in ['open', 'assigned', 'in_progress', 'resolved', 'closed', 'false_positive']:
-            query = select(func.count()).select_from(Ticket).where(Ticket.status == status)
-            if filters:
-                query = query.where(and_(*filters))
-            result = await db.execute(query)
-            status_counts[status] = result.scalar()
-
-        # Count by severity
-        severity_counts = {}
-        for severity in ['critical', 'high', 'medium', 'low', 'info']:
-            query = select(func.count()).select_from(Ticket).where(Ticket.severity == severity)
-            if filters:
-                query = query.where(and_(*filters))
-            result = await db.execute(query)
-            severity_counts[severity] = result.scalar()
-
-        # SLA breaches
-        sla_breach_query = select(func.count()).select_from(Ticket).where(Ticket.sla_breach == True)
-        if filters:
-            sla_breach_query = sla_breach_query.where(and_(*filters))
-        sla_breach_result = await db.execute(sla_breach_query)
-        sla_breaches = sla_breach_result.scalar()
-
-        return {
-            "total_tickets": total,
-            "by_status": status_counts,
-            "by_severity": severity_counts,
-            "sla_breaches": sla_breaches,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-
-    except Exception as e:
-        logger.error("Failed to get ticket stats", error=str(e))
-        raise HTTPException(status_code=500, detail="Failed to get ticket stats")
-
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
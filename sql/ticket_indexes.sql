@@ -0,0 +1,19 @@
+-- Indexes backing the ticket list and stats queries of the ticket service.
+--
+-- The tickets table is owned by the vms-shared package, so these statements
+-- belong in its Alembic history (e.g. op.execute() inside
+-- op.get_context().autocommit_block()) rather than in the service itself.
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block; if a build
+-- fails, drop the INVALID index it leaves behind before re-running.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tickets_org_status_created
+    ON tickets (organization_id, status, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tickets_org_created
+    ON tickets (organization_id, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tickets_sla_breach
+    ON tickets (organization_id) WHERE sla_breach = true;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tickets_created_id
+    ON tickets (created_at DESC, id DESC);